@@ -3,6 +3,7 @@
 Simple launcher for Ultimate RSI Tracker
 """
 
+import importlib
 import subprocess
 import sys
 import os
@@ -25,9 +26,19 @@ def main():
         return
     
     try:
-        # Launch the application
+        # Launch the application in this interpreter to skip a second cold start
         print(f"🔧 Starting {launcher_file}...")
-        subprocess.run([sys.executable, launcher_file])
+        if os.getcwd() not in sys.path:
+            sys.path.insert(0, os.getcwd())
+        
+        try:
+            app = importlib.import_module(launcher_file[:-3])
+        except Exception as e:
+            print(f"⚠️ In-process import failed ({e}), falling back to a subprocess")
+            subprocess.run([sys.executable, launcher_file])
+            return
+        
+        app.main()
     except KeyboardInterrupt:
         print("\n👋 RSI Tracker closed by user")
     except Exception as e:
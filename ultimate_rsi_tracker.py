@@ -13,56 +13,288 @@ Author: Claude (Widget Fix Version)
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import yfinance as yf
 import pandas as pd
 import numpy as np
 import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import os
 import webbrowser
 import csv
-from typing import Dict, List, Optional
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-# Chart imports
-CHARTS_AVAILABLE = False
+# RSI kernels are JIT-compiled when numba is installed, plain Python loops otherwise
+NUMBA_AVAILABLE = False
 try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import matplotlib.dates as mdates
-    plt.style.use('dark_background')
-    CHARTS_AVAILABLE = True
-    print("✅ Charts available")
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    print("⚠️ Charts not available - install matplotlib")
-    CHARTS_AVAILABLE = False
+    print("⚠️ numba not available - RSI will run uncompiled")
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Cached frames are handed out without copies; Copy-on-Write (always on from
+# pandas 3) keeps any caller-side edits from leaking back into the cache
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Chart imports are deferred until the first chart is drawn (matplotlib is slow to import)
+plt = mdates = Figure = FigureCanvasTkAgg = None
+_charts_loaded = None  # None until the import has been attempted
+
+def _load_mpl() -> bool:
+    """Import matplotlib on first use; returns whether charts are available."""
+    global plt, mdates, Figure, FigureCanvasTkAgg, _charts_loaded
+    if _charts_loaded is None:
+        try:
+            import matplotlib
+            matplotlib.use('TkAgg')
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            import matplotlib.dates as mdates
+            plt.style.use('dark_background')
+            _charts_loaded = True
+            print("✅ Charts available")
+        except ImportError:
+            print("⚠️ Charts not available - install matplotlib")
+            _charts_loaded = False
+    return _charts_loaded
+
+def charts_available() -> bool:
+    return _load_mpl()
+
+# yfinance is likewise imported on the first data request
+_yf_module = None
+
+def _yf():
+    global _yf_module
+    if _yf_module is None:
+        import yfinance
+        _yf_module = yfinance
+    return _yf_module
+
+def _make_session():
+    """HTTP session shared by all yfinance calls so connections are kept alive."""
+    try:
+        # Recent yfinance releases only accept curl_cffi sessions
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                              max_retries=Retry(total=3, backoff_factor=0.3)))
+        return session
+
+# On-disk price cache (parquet needs pyarrow)
+PARQUET_AVAILABLE = False
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    print("⚠️ Disk cache not available - install pyarrow")
+    PARQUET_AVAILABLE = False
+
+# US market session (ET); the close allows a few minutes for closing prints to settle
+try:
+    from zoneinfo import ZoneInfo
+    MARKET_TZ = ZoneInfo('America/New_York')
+except (ImportError, KeyError):
+    MARKET_TZ = None  # Python < 3.9 or no tz database: fall back to plain TTL
+MARKET_OPEN = (9, 30)
+MARKET_CLOSE = (16, 15)
+
+# Price columns are stored as float32; ~7 significant digits is plenty for charts and RSI
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# Window kept in each disk-cached history file, by fetch period
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+}
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_from_moves_nb(gains, losses, period):
+    """Wilder-smoothed RSI from per-bar gains/losses; one value per price, first `period` NaN."""
+    n = gains.shape[0] + 1
+    rsi = np.empty(n, dtype=np.float64)
+    for i in range(period):
+        rsi[i] = np.nan
+    
+    # Seed with a simple average of the first `period` moves
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+    
+    for i in range(period, n):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        
+        if avg_loss == 0:
+            rsi[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            rsi[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    return rsi
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_wilder_nb(arr, period):
+    """Wilder's RSI over a price array; the first `period` values are NaN."""
+    n = arr.shape[0]
+    gains = np.zeros(n - 1, dtype=np.float64)
+    losses = np.zeros(n - 1, dtype=np.float64)
+    for i in range(1, n):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0:
+            gains[i - 1] = delta
+        else:
+            losses[i - 1] = -delta
+    
+    return _rsi_from_moves_nb(gains, losses, period)
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _wilder_averages_nb(arr, period):
+    """Wilder-smoothed (avg_gain, avg_loss) after the last of at least period + 1 prices."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, arr.shape[0]):
+        delta = arr[i] - arr[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    
+    return avg_gain, avg_loss
 
 class RSICalculator:
     @staticmethod
     def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+        """Wilder's RSI, computed by the compiled `_rsi_wilder_nb` kernel."""
         if len(prices) < period + 1:
             return pd.Series([50.0] * len(prices), index=prices.index)
         
-        deltas = prices.diff()
-        gains = deltas.where(deltas > 0, 0)
-        losses = -deltas.where(deltas < 0, 0)
+        arr = RSICalculator._as_price_array(prices)
+        rsi = _rsi_wilder_nb(arr, period)
         
-        avg_gains = gains.rolling(window=period).mean()
-        avg_losses = losses.rolling(window=period).mean()
+        # Fill the warm-up NaNs in place and wrap the array without copying it
+        np.nan_to_num(rsi, copy=False, nan=50.0)
+        return pd.Series(rsi, index=prices.index, copy=False)
+    
+    @staticmethod
+    def calculate_multi(prices: pd.Series, periods=(14, 21, 50)) -> Dict[int, pd.Series]:
+        """RSI for several periods, differencing the prices only once."""
+        arr = RSICalculator._as_price_array(prices)
+        deltas = np.diff(arr)
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
         
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
+        results = {}
+        for period in periods:
+            if len(prices) < period + 1:
+                results[period] = pd.Series([50.0] * len(prices), index=prices.index)
+            else:
+                rsi = _rsi_from_moves_nb(gains, losses, period)
+                np.nan_to_num(rsi, copy=False, nan=50.0)
+                results[period] = pd.Series(rsi, index=prices.index, copy=False)
         
-        return rsi.fillna(50.0)
+        return results
+    
+    @staticmethod
+    def initial_state(prices: pd.Series, period: int = 14) -> Optional[Tuple[float, float, float]]:
+        """Wilder state (avg_gain, avg_loss, last_price) after the last price, or None if too short."""
+        if len(prices) < period + 1:
+            return None
+        
+        arr = RSICalculator._as_price_array(prices)
+        avg_gain, avg_loss = _wilder_averages_nb(arr, period)
+        return avg_gain, avg_loss, float(arr[-1])
+    
+    @staticmethod
+    def update(state: Tuple[float, float, float], price: float, period: int = 14) -> Tuple[Tuple[float, float, float], float]:
+        """Advance a Wilder state by one bar in O(1); returns the new state and that bar's RSI."""
+        avg_gain, avg_loss, last_price = state
+        delta = price - last_price
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+        
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else 50.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return (avg_gain, avg_loss, price), rsi
+    
+    @staticmethod
+    def warm_up():
+        """Compile (or load from numba's cache) the kernels before the first real call."""
+        dummy = pd.Series(np.linspace(100.0, 110.0, 32))
+        for dtype in ('float32', 'float64'):
+            RSICalculator.calculate_multi(dummy.astype(dtype), periods=(14,))
+            RSICalculator.calculate_rsi(dummy.astype(dtype))
+            RSICalculator.initial_state(dummy.astype(dtype))
+    
+    @staticmethod
+    def _as_price_array(prices: pd.Series) -> np.ndarray:
+        """float32 closes pass through as-is; the kernels accumulate in float64."""
+        arr = prices.to_numpy()
+        if arr.dtype != np.float32:
+            arr = arr.astype(np.float64, copy=False)
+        return arr
+
+# (threshold, suffix, decimals) for compact labels, largest first
+CAP_SCALES = ((1_000_000_000_000, 'T', 2), (1_000_000_000, 'B', 2), (1_000_000, 'M', 1))
+VOLUME_SCALES = ((1_000_000_000, 'B', 2), (1_000_000, 'M', 1), (1_000, 'K', 1))
+
+@lru_cache(maxsize=4096)
+def _format_market_cap(market_cap: int) -> str:
+    # Market caps repeat across refreshes of the same symbol, so memoize
+    for scale, suffix, decimals in CAP_SCALES:
+        if market_cap >= scale:
+            return f"${market_cap / scale:.{decimals}f}{suffix}"
+    return f"${market_cap:,.0f}"
 
 class FixedStockData:
     def __init__(self):
-        self.cache = {}
+        self.cache = OrderedDict()  # LRU order, oldest first
+        self.cache_maxsize = 256
+        self._symbol_keys = {}  # symbol -> cache keys held for it, so a symbol evicts without a scan
+        self._cache_lock = threading.Lock()  # held only for dict operations, never across a download
         self.cache_timeout = 300
+        self._session = None  # created on first fetch
+        self._session_lock = threading.Lock()
+        self._info_cache = {}  # symbol -> (timestamp, info)
+        self._inflight = {}  # cache_key -> Future of a fetch in progress
+        self._inflight_lock = threading.Lock()
+        
+        # Daily histories persist across launches; only new bars are fetched
+        self.disk_cache_dir = os.path.join(os.path.expanduser("~"), ".rsi_cache")
+        self.disk_cache_max_age = 30 * 24 * 3600
+        self.disk_cache_max_bytes = 200 * 1024 * 1024
+        self._prune_disk_cache()
     
     def get_stock_data(self, symbol: str, period: str = "6mo") -> Optional[pd.DataFrame]:
         # FIXED: Create proper cache key that includes actual fetch period
@@ -72,28 +304,48 @@ class FixedStockData:
         
         print(f"🔍 FIXED: Requesting {symbol} for period='{period}' (fetch='{fetch_period}')")
         
-        if cache_key in self.cache:
-            data, timestamp = self.cache[cache_key]
-            if current_time - timestamp < self.cache_timeout:
-                print(f"📁 Using cached data for {symbol} ({period})")
-                return self._filter_data_for_period(data, period)
+        data = self._cache_get(cache_key, current_time)
+        if data is not None:
+            print(f"📁 Using cached data for {symbol} ({period})")
+            return self._filter_data_for_period(data, period)
+        
+        # Concurrent requests for the same data wait on a single download
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = Future()
+        if not is_owner:
+            print(f"⏳ Waiting for in-flight fetch of {symbol} ({period})")
+            return future.result()
         
+        result = None
+        try:
+            result = self._fetch_stock_data(symbol, period, fetch_period, cache_key, current_time)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            future.set_result(result)
+    
+    def _fetch_stock_data(self, symbol: str, period: str, fetch_period: str,
+                          cache_key: str, current_time: float) -> Optional[pd.DataFrame]:
+        """Download (or extend from disk) the history behind one cache entry."""
         try:
             print(f"🌐 FIXED: Fetching {symbol} data - period='{period}', fetch_period='{fetch_period}'")
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol, session=self._get_session())
             
-            # Check if symbol exists first
-            info = None
-            try:
-                info = ticker.info
-                if not info or 'regularMarketPrice' not in info and 'currentPrice' not in info:
-                    print(f"⚠️ {symbol}: possibly delisted; no price data found")
-                    return None
-            except Exception as e:
-                print(f"⚠️ {symbol}: Error getting info - {e}")
+            # Warm start: reuse the on-disk history, extending it only once it is stale
+            data, disk_saved_at = self._load_from_disk(ticker, symbol, fetch_period, current_time)
+            disk_is_current = disk_saved_at is not None
             
             # FIXED: Use proper period handling with correct yfinance calls
-            if period in ['1d']:
+            if data is not None:
+                if disk_is_current:
+                    print(f"💾 Using disk-cached {symbol} history ({len(data)} points)")
+                else:
+                    print(f"💾 Extended disk-cached {symbol} history to {len(data)} points")
+            elif period in ['1d']:
                 data = ticker.history(period=period, interval='5m')
                 if data.empty:
                     data = ticker.history(period=period)
@@ -108,15 +360,13 @@ class FixedStockData:
                 data = ticker.history(period=period)
             
             if data is not None and not data.empty:
-                if 'Volume' not in data.columns:
-                    data['Volume'] = 0
-                
-                data = data.dropna(subset=['Close'])
-                data = data[data['Close'] > 0]
+                data = self._clean_data(data)
                 
                 if len(data) > 0:
-                    # FIXED: Cache the raw data, filter when needed
-                    self.cache[cache_key] = (data.copy(), current_time)
+                    # FIXED: Cache the raw data, filter when needed (stamped with when it was really fetched)
+                    self._cache_put(cache_key, data, disk_saved_at if disk_is_current else current_time)
+                    if not disk_is_current:
+                        self._save_to_disk(data, symbol, fetch_period)
                     
                     # Filter for the requested period
                     filtered_data = self._filter_data_for_period(data, period)
@@ -124,13 +374,355 @@ class FixedStockData:
                     print(f"✅ FIXED: Fetched {len(data)} raw points, filtered to {len(filtered_data)} for {symbol} ({period})")
                     return filtered_data
             
-            print(f"❌ No data available for {symbol} ({period})")
+            # An empty history is how delisted or unknown symbols show up
+            print(f"❌ No data available for {symbol} ({period}) - possibly delisted")
             return None
             
         except Exception as e:
             print(f"❌ Error fetching {symbol} data: {e}")
             return None
     
+    def get_many(self, symbols: List[str], period: str = "6mo", chunk_size: int = 20,
+                 max_age: Optional[float] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch several symbols at once, one yf.download request per chunk of symbols.
+        
+        max_age overrides cache_timeout for callers that need fresher prices (the table refresh).
+        """
+        fetch_period = self._get_actual_fetch_period(period)
+        interval = self._get_fetch_interval(period)
+        current_time = time.time()
+        results = {}
+        
+        # Serve what we can from the cache, batch-fetch the rest
+        to_fetch = []
+        for symbol in symbols:
+            cache_key = f"{symbol}_{fetch_period}_{period}"
+            data = self._cache_get(cache_key, current_time, max_age)
+            if data is not None:
+                results[symbol] = self._filter_data_for_period(data, period)
+                continue
+            to_fetch.append(symbol)
+        
+        pending = iter(to_fetch)
+        while True:
+            chunk = list(itertools.islice(pending, chunk_size))
+            if not chunk:
+                break
+            
+            print(f"🌐 Batch fetching {len(chunk)} symbols - period='{period}', fetch_period='{fetch_period}'")
+            try:
+                # Adjusted closes like Ticker.history, which fills the same cache keys and disk files
+                # (yfinance < 0.2.51 defaults download() to auto_adjust=False)
+                batch = _yf().download(tickers=" ".join(chunk), period=fetch_period, interval=interval,
+                                       group_by='ticker', auto_adjust=True, ignore_tz=True,
+                                       threads=True, progress=False,
+                                       session=self._get_session())
+            except Exception as e:
+                print(f"❌ Error batch fetching {', '.join(chunk)}: {e}")
+                batch = None
+            
+            for symbol in chunk:
+                results[symbol] = None
+                if batch is None or batch.empty:
+                    continue
+                
+                if isinstance(batch.columns, pd.MultiIndex):
+                    if symbol not in batch.columns.get_level_values(0):
+                        continue
+                    data = batch[symbol]
+                else:
+                    data = batch
+                
+                data = self._clean_data(data)
+                if len(data) > 0:
+                    self._cache_put(f"{symbol}_{fetch_period}_{period}", data, current_time)
+                    self._save_to_disk(data, symbol, fetch_period)
+                    results[symbol] = self._filter_data_for_period(data, period)
+                else:
+                    print(f"❌ No data available for {symbol} ({period})")
+        
+        return results
+    
+    def scan_rsi(self, symbols: List[str], period: str = "1mo", rsi_period: int = 14) -> Dict[str, Optional[pd.Series]]:
+        """RSI for a whole watchlist: one batched fetch, then RSI on all cores."""
+        frames = self.get_many(symbols, period)
+        
+        def rsi_for(symbol):
+            data = frames.get(symbol)
+            if data is None or data.empty:
+                return None
+            return RSICalculator.calculate_rsi(data['Close'], rsi_period)
+        
+        # The numba kernel releases the GIL, so threads run truly in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(symbols, executor.map(rsi_for, symbols)))
+    
+    def _is_fresh(self, timestamp: float, current_time: float, max_age: Optional[float] = None) -> bool:
+        """Fresh within max_age (default cache_timeout), or if fetched after the last close while the market is shut."""
+        if current_time - timestamp < (self.cache_timeout if max_age is None else max_age):
+            return True
+        
+        last_close = self._last_market_close()
+        return last_close is not None and timestamp >= last_close
+    
+    def _last_market_close(self) -> Optional[float]:
+        """Epoch time of the most recent session close, or None while the market is open."""
+        if MARKET_TZ is None:
+            return None
+        
+        now = datetime.now(MARKET_TZ)
+        market_open = now.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1], second=0, microsecond=0)
+        close = now.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1], second=0, microsecond=0)
+        if now.weekday() < 5 and market_open <= now < close:
+            return None
+        
+        # Walk back to the latest weekday close at or before now (holidays count as open days)
+        if now < close:
+            close -= timedelta(days=1)
+        while close.weekday() >= 5:
+            close -= timedelta(days=1)
+        return close.timestamp()
+    
+    def fetched_at(self, symbol: str, period: str) -> Optional[float]:
+        """Epoch time the cached data behind get_stock_data(symbol, period) was downloaded."""
+        cache_key = f"{symbol}_{self._get_actual_fetch_period(period)}_{period}"
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+        return entry[1] if entry is not None else None
+    
+    def _cache_get(self, cache_key: str, current_time: float, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Raw cached frame if present and fresh, marking it recently used."""
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is None or not self._is_fresh(entry[1], current_time, max_age):
+                return None
+            self.cache.move_to_end(cache_key)
+            return entry[0]
+    
+    def _cache_put(self, cache_key: str, data: pd.DataFrame, timestamp: float):
+        """Store a raw frame, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            if cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+            elif len(self.cache) >= self.cache_maxsize:
+                oldest_key, _ = self.cache.popitem(last=False)
+                self._unindex_key(oldest_key)
+            
+            # Cached frames are never mutated, so no defensive copy is needed
+            self.cache[cache_key] = (data, timestamp)
+            self._symbol_keys.setdefault(self._key_symbol(cache_key), set()).add(cache_key)
+    
+    def evict_symbol(self, symbol: str) -> list:
+        """Drop everything cached for a symbol (memory, info and disk) and return the removed memory keys."""
+        with self._cache_lock:
+            keys = self._symbol_keys.pop(symbol, ())
+            for key in keys:
+                self.cache.pop(key, None)
+        self._info_cache.pop(symbol, None)
+        
+        # A fresh disk copy would otherwise be served again without a download
+        if os.path.isdir(self.disk_cache_dir):
+            for entry in os.scandir(self.disk_cache_dir):
+                name = entry.name
+                if name.endswith('.parquet') and name[:-len('.parquet')].rsplit('_', 1)[0] == symbol:
+                    self._remove_disk_file(entry.path)
+        return sorted(keys)
+    
+    @staticmethod
+    def _key_symbol(cache_key: str) -> str:
+        # Keys are "{symbol}_{fetch_period}_{period}"; periods never contain '_'
+        return cache_key.rsplit('_', 2)[0]
+    
+    def _unindex_key(self, cache_key: str):
+        symbol = self._key_symbol(cache_key)
+        keys = self._symbol_keys.get(symbol)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._symbol_keys[symbol]
+    
+    def _clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Keep OHLCV only, drop rows without a usable close and downcast prices."""
+        if 'Volume' not in data.columns:
+            data = data.assign(Volume=0)
+        # Dividends / Stock Splits / Capital Gains are never read; don't hold them in the caches
+        data = data[[col for col in (*PRICE_COLUMNS, 'Volume') if col in data.columns]]
+        
+        # One pass drops missing, infinite and non-positive closes; most downloads have none
+        close = data['Close'].to_numpy(dtype=np.float64)
+        valid = np.isfinite(close) & (close > 0)
+        if not valid.all():
+            data = data.iloc[valid]
+        
+        # Volume keeps its int64 width: split-adjusted histories overflow int32
+        return self._naive_index(data.astype({col: 'float32' for col in PRICE_COLUMNS if col in data.columns}))
+    
+    @staticmethod
+    def _naive_index(data: pd.DataFrame) -> pd.DataFrame:
+        """Exchange-local wall-clock index without a timezone.
+        
+        yf.download drops the zone for daily bars while Ticker.history keeps it; both paths
+        fill the same caches, so every stored frame uses the download's naive form.
+        """
+        tz = getattr(data.index, 'tz', None)
+        if tz is None:
+            return data
+        return data.set_axis(data.index.tz_localize(None))
+    
+    def _get_fetch_interval(self, period: str) -> str:
+        """Bar interval used when downloading the given period."""
+        if period == '1d':
+            return '5m'
+        elif period == '5d':
+            return '1h'
+        else:
+            return '1d'
+    
+    def _get_session(self):
+        # First fetches arrive from several executor threads at once; only one may build the session
+        with self._session_lock:
+            if self._session is None:
+                self._session = _make_session()
+            return self._session
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def _disk_cache_path(self, symbol: str, fetch_period: str) -> str:
+        return os.path.join(self.disk_cache_dir, f"{symbol}_{fetch_period}.parquet")
+    
+    def _uses_disk_cache(self, fetch_period: str) -> bool:
+        """Only daily histories are persisted; intraday bars go stale too quickly."""
+        return PARQUET_AVAILABLE and self._get_fetch_interval(fetch_period) == '1d'
+    
+    def _load_from_disk(self, ticker, symbol: str, fetch_period: str,
+                        current_time: float) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
+        """Read a persisted history; unless it is still fresh, append the bars published since.
+        
+        Returns the data and, when it came straight from disk without a network call, its fetch time.
+        """
+        path = self._disk_cache_path(symbol, fetch_period)
+        if not self._uses_disk_cache(fetch_period):
+            return None, None
+        
+        try:
+            saved_at = os.path.getmtime(path)
+            data = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            print(f"⚠️ {symbol}: Unreadable disk cache - {e}")
+            return None, None
+        
+        if data.empty:
+            return None, None
+        data = self._naive_index(data)  # files written before indexes were stored tz-naive
+        
+        # The file's mtime is its fetch time, so the memory cache's freshness rule applies
+        if self._is_fresh(saved_at, current_time):
+            return data, saved_at
+        
+        # Refetch from the last stored day, which may have been saved mid-session
+        last_day = data.index[-1].strftime('%Y-%m-%d')
+        new_data = ticker.history(start=last_day)
+        if new_data is not None and not new_data.empty:
+            new_data = self._naive_index(new_data)
+            
+            # Prices are split/dividend adjusted, so after a corporate action the stored bars are
+            # on a different scale; refetch the whole history rather than splice the two
+            if self._history_was_adjusted(data, new_data):
+                print(f"⚠️ {symbol}: Split/dividend since the disk cache was saved - refetching full history")
+                self._remove_disk_file(path)
+                return None, None
+            
+            new_data = self._clean_data(new_data)
+            if len(new_data) > 0:
+                try:
+                    data = pd.concat([data[data.index < new_data.index[0]], new_data])
+                except (TypeError, ValueError) as e:
+                    # Incompatible indexes: a full download beats failing the whole fetch
+                    print(f"⚠️ {symbol}: Could not extend disk cache ({e}) - refetching full history")
+                    self._remove_disk_file(path)
+                    return None, None
+        
+        offset = PERIOD_OFFSETS.get(fetch_period)
+        if offset is not None:
+            data = data[data.index >= data.index[-1] - offset]
+        
+        return data, None
+    
+    @staticmethod
+    def _history_was_adjusted(stored: pd.DataFrame, new_data: pd.DataFrame) -> bool:
+        """Whether freshly fetched bars can't be appended to stored ones (corporate action or rescaled overlap)."""
+        for col in ('Stock Splits', 'Dividends'):
+            if col in new_data.columns and (new_data[col].fillna(0) != 0).any():
+                return True
+        
+        # The refetch starts at the last stored day; that bar must still match what was stored
+        overlap = stored['Close'].reindex(new_data.index).dropna()
+        if overlap.empty:
+            return False
+        refetched = new_data['Close'].reindex(overlap.index).to_numpy(dtype=np.float64)
+        return not np.allclose(overlap.to_numpy(dtype=np.float64), refetched, rtol=1e-3)
+    
+    @staticmethod
+    def _remove_disk_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _save_to_disk(self, data: pd.DataFrame, symbol: str, fetch_period: str):
+        if not self._uses_disk_cache(fetch_period):
+            return
+        
+        # The tick and chart workers can save the same symbol at once: write a private temp file and swap it in
+        path = self._disk_cache_path(symbol, fetch_period)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.disk_cache_dir, exist_ok=True)
+            data.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ {symbol}: Could not write disk cache - {e}")
+            self._remove_disk_file(tmp_path)
+    
+    def _prune_disk_cache(self):
+        """Drop persisted histories untouched for a month, then the oldest ones beyond the size cap."""
+        if not os.path.isdir(self.disk_cache_dir):
+            return
+        
+        cutoff = time.time() - self.disk_cache_max_age
+        kept = []
+        for entry in os.scandir(self.disk_cache_dir):
+            try:
+                # Temp files are only left behind by a crash mid-write
+                if entry.name.endswith('.tmp') and entry.stat().st_mtime < time.time() - 3600:
+                    os.remove(entry.path)
+                if not entry.name.endswith('.parquet'):
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime < cutoff:
+                    os.remove(entry.path)
+                else:
+                    kept.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                pass
+        
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= self.disk_cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
     def _get_actual_fetch_period(self, period: str) -> str:
         """FIXED: Get the actual period to fetch from yfinance."""
         if period in ['max', '10y', '5y']:
@@ -141,51 +733,51 @@ class FixedStockData:
     def _filter_data_for_period(self, data: pd.DataFrame, period: str) -> pd.DataFrame:
         """FIXED: Filter data to the exact requested period."""
         if period == '5y':
-            cutoff_date = datetime.now() - timedelta(days=1825)
-            filtered = data[data.index >= cutoff_date]
+            filtered = self._slice_since(data, 1825)
             print(f"🔧 FIXED: Filtered 5y data: {len(data)} -> {len(filtered)} points")
             return filtered
         elif period == '10y':
-            cutoff_date = datetime.now() - timedelta(days=3650)
-            filtered = data[data.index >= cutoff_date]
+            filtered = self._slice_since(data, 3650)
             print(f"🔧 FIXED: Filtered 10y data: {len(data)} -> {len(filtered)} points")
             return filtered
         else:
             return data
     
+    def _slice_since(self, data: pd.DataFrame, days: int) -> pd.DataFrame:
+        """Rows from the last `days` days via binary search on the sorted index."""
+        # Indexes are exchange-local and tz-naive; hours of skew are irrelevant at a years-long cutoff
+        cutoff = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days))
+        start = data.index.values.searchsorted(cutoff)
+        return data.iloc[start:]
+    
     def get_stock_info(self, symbol: str) -> Dict:
+        # ticker.info is a large JSON request; reuse it for cache_timeout seconds
+        cached = self._info_cache.get(symbol)
+        if cached and time.time() - cached[0] < self.cache_timeout:
+            return cached[1]
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol, session=self._get_session())
             info = ticker.info
             
-            return {
+            result = {
                 'shares_outstanding': info.get('sharesOutstanding', 0),
                 'market_cap': info.get('marketCap', 0),
                 'current_price': info.get('currentPrice') or info.get('regularMarketPrice'),
                 'company_name': info.get('longName', symbol)
             }
+            self._info_cache[symbol] = (time.time(), result)
+            return result
         except:
             return {'shares_outstanding': 0, 'market_cap': 0, 'current_price': None, 'company_name': symbol}
     
     def format_market_cap(self, market_cap: int) -> str:
-        if market_cap >= 1_000_000_000_000:
-            return f"${market_cap / 1_000_000_000_000:.2f}T"
-        elif market_cap >= 1_000_000_000:
-            return f"${market_cap / 1_000_000_000:.2f}B"
-        elif market_cap >= 1_000_000:
-            return f"${market_cap / 1_000_000:.1f}M"
-        else:
-            return f"${market_cap:,.0f}"
+        return _format_market_cap(market_cap)
     
     def format_volume(self, volume: int) -> str:
-        if volume >= 1_000_000_000:
-            return f"{volume / 1_000_000_000:.2f}B"
-        elif volume >= 1_000_000:
-            return f"{volume / 1_000_000:.1f}M"
-        elif volume >= 1_000:
-            return f"{volume / 1_000:.1f}K"
-        else:
-            return f"{volume:,}"
+        for scale, suffix, decimals in VOLUME_SCALES:
+            if volume >= scale:
+                return f"{volume / scale:.{decimals}f}{suffix}"
+        return f"{volume:,}"
 
 # Note: Main application class implementation would continue here
 # This is a condensed version for GitHub upload
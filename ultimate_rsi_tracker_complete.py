@@ -13,56 +13,333 @@ Author: Claude (Widget Fix Version)
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import yfinance as yf
 import pandas as pd
 import numpy as np
 import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import os
 import webbrowser
 import csv
-from typing import Dict, List, Optional
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-# Chart imports
-CHARTS_AVAILABLE = False
+# RSI kernels are JIT-compiled when numba is installed, plain Python loops otherwise
+NUMBA_AVAILABLE = False
 try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import matplotlib.dates as mdates
-    plt.style.use('dark_background')
-    CHARTS_AVAILABLE = True
-    print("✅ Charts available")
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    print("⚠️ Charts not available - install matplotlib")
-    CHARTS_AVAILABLE = False
+    print("⚠️ numba not available - RSI will run uncompiled")
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# orjson (optional) reads and writes the watchlist file several times faster than json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Cached frames are handed out without copies; Copy-on-Write (always on from
+# pandas 3) keeps any caller-side edits from leaking back into the cache
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Chart imports are deferred until the first chart is drawn (matplotlib is slow to import)
+plt = mdates = Figure = FigureCanvasTkAgg = None
+_charts_loaded = None  # None until the import has been attempted
+
+def _load_mpl() -> bool:
+    """Import matplotlib on first use; returns whether charts are available."""
+    global plt, mdates, Figure, FigureCanvasTkAgg, _charts_loaded
+    if _charts_loaded is None:
+        try:
+            import matplotlib
+            matplotlib.use('TkAgg')
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            import matplotlib.dates as mdates
+            plt.style.use('dark_background')
+            _charts_loaded = True
+            print("✅ Charts available")
+        except ImportError:
+            print("⚠️ Charts not available - install matplotlib")
+            _charts_loaded = False
+    return _charts_loaded
+
+def charts_available() -> bool:
+    return _load_mpl()
+
+# yfinance is likewise imported on the first data request
+_yf_module = None
+
+def _yf():
+    global _yf_module
+    if _yf_module is None:
+        import yfinance
+        _yf_module = yfinance
+    return _yf_module
+
+def _make_session():
+    """HTTP session shared by all yfinance calls so connections are kept alive."""
+    try:
+        # Recent yfinance releases only accept curl_cffi sessions
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                              max_retries=Retry(total=3, backoff_factor=0.3)))
+        return session
+
+# On-disk price cache (parquet needs pyarrow)
+PARQUET_AVAILABLE = False
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    print("⚠️ Disk cache not available - install pyarrow")
+    PARQUET_AVAILABLE = False
+
+# US market session (ET); the close allows a few minutes for closing prints to settle
+try:
+    from zoneinfo import ZoneInfo
+    MARKET_TZ = ZoneInfo('America/New_York')
+except (ImportError, KeyError):
+    MARKET_TZ = None  # Python < 3.9 or no tz database: fall back to plain TTL
+MARKET_OPEN = (9, 30)
+MARKET_CLOSE = (16, 15)
+
+# Price columns are stored as float32; ~7 significant digits is plenty for charts and RSI
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# Window kept in each disk-cached history file, by fetch period
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+}
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_from_moves_nb(gains, losses, period):
+    """Wilder-smoothed RSI from per-bar gains/losses; one value per price, first `period` NaN."""
+    n = gains.shape[0] + 1
+    rsi = np.empty(n, dtype=np.float64)
+    for i in range(period):
+        rsi[i] = np.nan
+    
+    # Seed with a simple average of the first `period` moves
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+    
+    for i in range(period, n):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        
+        if avg_loss == 0:
+            rsi[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            rsi[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    return rsi
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_wilder_nb(arr, period):
+    """Wilder's RSI over a price array; the first `period` values are NaN."""
+    n = arr.shape[0]
+    gains = np.zeros(n - 1, dtype=np.float64)
+    losses = np.zeros(n - 1, dtype=np.float64)
+    for i in range(1, n):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0:
+            gains[i - 1] = delta
+        else:
+            losses[i - 1] = -delta
+    
+    return _rsi_from_moves_nb(gains, losses, period)
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _wilder_averages_nb(arr, period):
+    """Wilder-smoothed (avg_gain, avg_loss) after the last of at least period + 1 prices."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, arr.shape[0]):
+        delta = arr[i] - arr[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    
+    return avg_gain, avg_loss
+
+@njit(cache=True, nogil=True)
+def _lttb_indices_nb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points (n_out < len(y)) that keep the shape of y(x)."""
+    n = y.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    bucket = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        
+        # The third vertex is the average of the next bucket (the last point for the final one)
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(end, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= next_end - end
+        avg_y /= next_end - end
+        
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        out[i + 1] = best
+        a = best
+    
+    return out
 
 class RSICalculator:
     @staticmethod
     def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+        """Wilder's RSI, computed by the compiled `_rsi_wilder_nb` kernel."""
         if len(prices) < period + 1:
             return pd.Series([50.0] * len(prices), index=prices.index)
         
-        deltas = prices.diff()
-        gains = deltas.where(deltas > 0, 0)
-        losses = -deltas.where(deltas < 0, 0)
+        arr = RSICalculator._as_price_array(prices)
+        rsi = _rsi_wilder_nb(arr, period)
         
-        avg_gains = gains.rolling(window=period).mean()
-        avg_losses = losses.rolling(window=period).mean()
+        # Fill the warm-up NaNs in place and wrap the array without copying it
+        np.nan_to_num(rsi, copy=False, nan=50.0)
+        return pd.Series(rsi, index=prices.index, copy=False)
+    
+    @staticmethod
+    def calculate_multi(prices: pd.Series, periods=(14, 21, 50)) -> Dict[int, pd.Series]:
+        """RSI for several periods, differencing the prices only once."""
+        arr = RSICalculator._as_price_array(prices)
+        deltas = np.diff(arr)
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+        
+        results = {}
+        for period in periods:
+            if len(prices) < period + 1:
+                results[period] = pd.Series([50.0] * len(prices), index=prices.index)
+            else:
+                rsi = _rsi_from_moves_nb(gains, losses, period)
+                np.nan_to_num(rsi, copy=False, nan=50.0)
+                results[period] = pd.Series(rsi, index=prices.index, copy=False)
         
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
+        return results
+    
+    @staticmethod
+    def initial_state(prices: pd.Series, period: int = 14) -> Optional[Tuple[float, float, float]]:
+        """Wilder state (avg_gain, avg_loss, last_price) after the last price, or None if too short."""
+        if len(prices) < period + 1:
+            return None
         
-        return rsi.fillna(50.0)
+        arr = RSICalculator._as_price_array(prices)
+        avg_gain, avg_loss = _wilder_averages_nb(arr, period)
+        return avg_gain, avg_loss, float(arr[-1])
+    
+    @staticmethod
+    def update(state: Tuple[float, float, float], price: float, period: int = 14) -> Tuple[Tuple[float, float, float], float]:
+        """Advance a Wilder state by one bar in O(1); returns the new state and that bar's RSI."""
+        avg_gain, avg_loss, last_price = state
+        delta = price - last_price
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+        
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else 50.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return (avg_gain, avg_loss, price), rsi
+    
+    @staticmethod
+    def warm_up():
+        """Compile (or load from numba's cache) the kernels before the first real call."""
+        dummy = pd.Series(np.linspace(100.0, 110.0, 32))
+        for dtype in ('float32', 'float64'):
+            RSICalculator.calculate_multi(dummy.astype(dtype), periods=(14,))
+            RSICalculator.calculate_rsi(dummy.astype(dtype))
+            RSICalculator.initial_state(dummy.astype(dtype))
+    
+    @staticmethod
+    def _as_price_array(prices: pd.Series) -> np.ndarray:
+        """float32 closes pass through as-is; the kernels accumulate in float64."""
+        arr = prices.to_numpy()
+        if arr.dtype != np.float32:
+            arr = arr.astype(np.float64, copy=False)
+        return arr
+
+# (threshold, suffix, decimals) for compact labels, largest first
+CAP_SCALES = ((1_000_000_000_000, 'T', 2), (1_000_000_000, 'B', 2), (1_000_000, 'M', 1))
+VOLUME_SCALES = ((1_000_000_000, 'B', 2), (1_000_000, 'M', 1), (1_000, 'K', 1))
+
+@lru_cache(maxsize=4096)
+def _format_market_cap(market_cap: int) -> str:
+    # Market caps repeat across refreshes of the same symbol, so memoize
+    for scale, suffix, decimals in CAP_SCALES:
+        if market_cap >= scale:
+            return f"${market_cap / scale:.{decimals}f}{suffix}"
+    return f"${market_cap:,.0f}"
 
 class FixedStockData:
     def __init__(self):
-        self.cache = {}
+        self.cache = OrderedDict()  # LRU order, oldest first
+        self.cache_maxsize = 256
+        self._symbol_keys = {}  # symbol -> cache keys held for it, so a symbol evicts without a scan
+        self._cache_lock = threading.Lock()  # held only for dict operations, never across a download
         self.cache_timeout = 300
+        self._session = None  # created on first fetch
+        self._session_lock = threading.Lock()
+        self._info_cache = {}  # symbol -> (timestamp, info)
+        self._inflight = {}  # cache_key -> Future of a fetch in progress
+        self._inflight_lock = threading.Lock()
+        
+        # Daily histories persist across launches; only new bars are fetched
+        self.disk_cache_dir = os.path.join(os.path.expanduser("~"), ".rsi_cache")
+        self.disk_cache_max_age = 30 * 24 * 3600
+        self.disk_cache_max_bytes = 200 * 1024 * 1024
+        self._prune_disk_cache()
     
     def get_stock_data(self, symbol: str, period: str = "6mo") -> Optional[pd.DataFrame]:
         # FIXED: Create proper cache key that includes actual fetch period
@@ -72,28 +349,48 @@ class FixedStockData:
         
         print(f"🔍 FIXED: Requesting {symbol} for period='{period}' (fetch='{fetch_period}')")
         
-        if cache_key in self.cache:
-            data, timestamp = self.cache[cache_key]
-            if current_time - timestamp < self.cache_timeout:
-                print(f"📁 Using cached data for {symbol} ({period})")
-                return self._filter_data_for_period(data, period)
-        
+        data = self._cache_get(cache_key, current_time)
+        if data is not None:
+            print(f"📁 Using cached data for {symbol} ({period})")
+            return self._filter_data_for_period(data, period)
+        
+        # Concurrent requests for the same data wait on a single download
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = Future()
+        if not is_owner:
+            print(f"⏳ Waiting for in-flight fetch of {symbol} ({period})")
+            return future.result()
+        
+        result = None
+        try:
+            result = self._fetch_stock_data(symbol, period, fetch_period, cache_key, current_time)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            future.set_result(result)
+    
+    def _fetch_stock_data(self, symbol: str, period: str, fetch_period: str,
+                          cache_key: str, current_time: float) -> Optional[pd.DataFrame]:
+        """Download (or extend from disk) the history behind one cache entry."""
         try:
             print(f"🌐 FIXED: Fetching {symbol} data - period='{period}', fetch_period='{fetch_period}'")
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol, session=self._get_session())
             
-            # Check if symbol exists first
-            info = None
-            try:
-                info = ticker.info
-                if not info or 'regularMarketPrice' not in info and 'currentPrice' not in info:
-                    print(f"⚠️ {symbol}: possibly delisted; no price data found")
-                    return None
-            except Exception as e:
-                print(f"⚠️ {symbol}: Error getting info - {e}")
+            # Warm start: reuse the on-disk history, extending it only once it is stale
+            data, disk_saved_at = self._load_from_disk(ticker, symbol, fetch_period, current_time)
+            disk_is_current = disk_saved_at is not None
             
             # FIXED: Use proper period handling with correct yfinance calls
-            if period in ['1d']:
+            if data is not None:
+                if disk_is_current:
+                    print(f"💾 Using disk-cached {symbol} history ({len(data)} points)")
+                else:
+                    print(f"💾 Extended disk-cached {symbol} history to {len(data)} points")
+            elif period in ['1d']:
                 data = ticker.history(period=period, interval='5m')
                 if data.empty:
                     data = ticker.history(period=period)
@@ -108,15 +405,13 @@ class FixedStockData:
                 data = ticker.history(period=period)
             
             if data is not None and not data.empty:
-                if 'Volume' not in data.columns:
-                    data['Volume'] = 0
-                
-                data = data.dropna(subset=['Close'])
-                data = data[data['Close'] > 0]
+                data = self._clean_data(data)
                 
                 if len(data) > 0:
-                    # FIXED: Cache the raw data, filter when needed
-                    self.cache[cache_key] = (data.copy(), current_time)
+                    # FIXED: Cache the raw data, filter when needed (stamped with when it was really fetched)
+                    self._cache_put(cache_key, data, disk_saved_at if disk_is_current else current_time)
+                    if not disk_is_current:
+                        self._save_to_disk(data, symbol, fetch_period)
                     
                     # Filter for the requested period
                     filtered_data = self._filter_data_for_period(data, period)
@@ -124,13 +419,355 @@ class FixedStockData:
                     print(f"✅ FIXED: Fetched {len(data)} raw points, filtered to {len(filtered_data)} for {symbol} ({period})")
                     return filtered_data
             
-            print(f"❌ No data available for {symbol} ({period})")
+            # An empty history is how delisted or unknown symbols show up
+            print(f"❌ No data available for {symbol} ({period}) - possibly delisted")
             return None
             
         except Exception as e:
             print(f"❌ Error fetching {symbol} data: {e}")
             return None
     
+    def get_many(self, symbols: List[str], period: str = "6mo", chunk_size: int = 20,
+                 max_age: Optional[float] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch several symbols at once, one yf.download request per chunk of symbols.
+        
+        max_age overrides cache_timeout for callers that need fresher prices (the table refresh).
+        """
+        fetch_period = self._get_actual_fetch_period(period)
+        interval = self._get_fetch_interval(period)
+        current_time = time.time()
+        results = {}
+        
+        # Serve what we can from the cache, batch-fetch the rest
+        to_fetch = []
+        for symbol in symbols:
+            cache_key = f"{symbol}_{fetch_period}_{period}"
+            data = self._cache_get(cache_key, current_time, max_age)
+            if data is not None:
+                results[symbol] = self._filter_data_for_period(data, period)
+                continue
+            to_fetch.append(symbol)
+        
+        pending = iter(to_fetch)
+        while True:
+            chunk = list(itertools.islice(pending, chunk_size))
+            if not chunk:
+                break
+            
+            print(f"🌐 Batch fetching {len(chunk)} symbols - period='{period}', fetch_period='{fetch_period}'")
+            try:
+                # Adjusted closes like Ticker.history, which fills the same cache keys and disk files
+                # (yfinance < 0.2.51 defaults download() to auto_adjust=False)
+                batch = _yf().download(tickers=" ".join(chunk), period=fetch_period, interval=interval,
+                                       group_by='ticker', auto_adjust=True, ignore_tz=True,
+                                       threads=True, progress=False,
+                                       session=self._get_session())
+            except Exception as e:
+                print(f"❌ Error batch fetching {', '.join(chunk)}: {e}")
+                batch = None
+            
+            for symbol in chunk:
+                results[symbol] = None
+                if batch is None or batch.empty:
+                    continue
+                
+                if isinstance(batch.columns, pd.MultiIndex):
+                    if symbol not in batch.columns.get_level_values(0):
+                        continue
+                    data = batch[symbol]
+                else:
+                    data = batch
+                
+                data = self._clean_data(data)
+                if len(data) > 0:
+                    self._cache_put(f"{symbol}_{fetch_period}_{period}", data, current_time)
+                    self._save_to_disk(data, symbol, fetch_period)
+                    results[symbol] = self._filter_data_for_period(data, period)
+                else:
+                    print(f"❌ No data available for {symbol} ({period})")
+        
+        return results
+    
+    def scan_rsi(self, symbols: List[str], period: str = "1mo", rsi_period: int = 14) -> Dict[str, Optional[pd.Series]]:
+        """RSI for a whole watchlist: one batched fetch, then RSI on all cores."""
+        frames = self.get_many(symbols, period)
+        
+        def rsi_for(symbol):
+            data = frames.get(symbol)
+            if data is None or data.empty:
+                return None
+            return RSICalculator.calculate_rsi(data['Close'], rsi_period)
+        
+        # The numba kernel releases the GIL, so threads run truly in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(symbols, executor.map(rsi_for, symbols)))
+    
+    def _is_fresh(self, timestamp: float, current_time: float, max_age: Optional[float] = None) -> bool:
+        """Fresh within max_age (default cache_timeout), or if fetched after the last close while the market is shut."""
+        if current_time - timestamp < (self.cache_timeout if max_age is None else max_age):
+            return True
+        
+        last_close = self._last_market_close()
+        return last_close is not None and timestamp >= last_close
+    
+    def _last_market_close(self) -> Optional[float]:
+        """Epoch time of the most recent session close, or None while the market is open."""
+        if MARKET_TZ is None:
+            return None
+        
+        now = datetime.now(MARKET_TZ)
+        market_open = now.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1], second=0, microsecond=0)
+        close = now.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1], second=0, microsecond=0)
+        if now.weekday() < 5 and market_open <= now < close:
+            return None
+        
+        # Walk back to the latest weekday close at or before now (holidays count as open days)
+        if now < close:
+            close -= timedelta(days=1)
+        while close.weekday() >= 5:
+            close -= timedelta(days=1)
+        return close.timestamp()
+    
+    def fetched_at(self, symbol: str, period: str) -> Optional[float]:
+        """Epoch time the cached data behind get_stock_data(symbol, period) was downloaded."""
+        cache_key = f"{symbol}_{self._get_actual_fetch_period(period)}_{period}"
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+        return entry[1] if entry is not None else None
+    
+    def _cache_get(self, cache_key: str, current_time: float, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Raw cached frame if present and fresh, marking it recently used."""
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is None or not self._is_fresh(entry[1], current_time, max_age):
+                return None
+            self.cache.move_to_end(cache_key)
+            return entry[0]
+    
+    def _cache_put(self, cache_key: str, data: pd.DataFrame, timestamp: float):
+        """Store a raw frame, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            if cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+            elif len(self.cache) >= self.cache_maxsize:
+                oldest_key, _ = self.cache.popitem(last=False)
+                self._unindex_key(oldest_key)
+            
+            # Cached frames are never mutated, so no defensive copy is needed
+            self.cache[cache_key] = (data, timestamp)
+            self._symbol_keys.setdefault(self._key_symbol(cache_key), set()).add(cache_key)
+    
+    def evict_symbol(self, symbol: str) -> list:
+        """Drop everything cached for a symbol (memory, info and disk) and return the removed memory keys."""
+        with self._cache_lock:
+            keys = self._symbol_keys.pop(symbol, ())
+            for key in keys:
+                self.cache.pop(key, None)
+        self._info_cache.pop(symbol, None)
+        
+        # A fresh disk copy would otherwise be served again without a download
+        if os.path.isdir(self.disk_cache_dir):
+            for entry in os.scandir(self.disk_cache_dir):
+                name = entry.name
+                if name.endswith('.parquet') and name[:-len('.parquet')].rsplit('_', 1)[0] == symbol:
+                    self._remove_disk_file(entry.path)
+        return sorted(keys)
+    
+    @staticmethod
+    def _key_symbol(cache_key: str) -> str:
+        # Keys are "{symbol}_{fetch_period}_{period}"; periods never contain '_'
+        return cache_key.rsplit('_', 2)[0]
+    
+    def _unindex_key(self, cache_key: str):
+        symbol = self._key_symbol(cache_key)
+        keys = self._symbol_keys.get(symbol)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._symbol_keys[symbol]
+    
+    def _clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Keep OHLCV only, drop rows without a usable close and downcast prices."""
+        if 'Volume' not in data.columns:
+            data = data.assign(Volume=0)
+        # Dividends / Stock Splits / Capital Gains are never read; don't hold them in the caches
+        data = data[[col for col in (*PRICE_COLUMNS, 'Volume') if col in data.columns]]
+        
+        # One pass drops missing, infinite and non-positive closes; most downloads have none
+        close = data['Close'].to_numpy(dtype=np.float64)
+        valid = np.isfinite(close) & (close > 0)
+        if not valid.all():
+            data = data.iloc[valid]
+        
+        # Volume keeps its int64 width: split-adjusted histories overflow int32
+        return self._naive_index(data.astype({col: 'float32' for col in PRICE_COLUMNS if col in data.columns}))
+    
+    @staticmethod
+    def _naive_index(data: pd.DataFrame) -> pd.DataFrame:
+        """Exchange-local wall-clock index without a timezone.
+        
+        yf.download drops the zone for daily bars while Ticker.history keeps it; both paths
+        fill the same caches, so every stored frame uses the download's naive form.
+        """
+        tz = getattr(data.index, 'tz', None)
+        if tz is None:
+            return data
+        return data.set_axis(data.index.tz_localize(None))
+    
+    def _get_fetch_interval(self, period: str) -> str:
+        """Bar interval used when downloading the given period."""
+        if period == '1d':
+            return '5m'
+        elif period == '5d':
+            return '1h'
+        else:
+            return '1d'
+    
+    def _get_session(self):
+        # First fetches arrive from several executor threads at once; only one may build the session
+        with self._session_lock:
+            if self._session is None:
+                self._session = _make_session()
+            return self._session
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def _disk_cache_path(self, symbol: str, fetch_period: str) -> str:
+        return os.path.join(self.disk_cache_dir, f"{symbol}_{fetch_period}.parquet")
+    
+    def _uses_disk_cache(self, fetch_period: str) -> bool:
+        """Only daily histories are persisted; intraday bars go stale too quickly."""
+        return PARQUET_AVAILABLE and self._get_fetch_interval(fetch_period) == '1d'
+    
+    def _load_from_disk(self, ticker, symbol: str, fetch_period: str,
+                        current_time: float) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
+        """Read a persisted history; unless it is still fresh, append the bars published since.
+        
+        Returns the data and, when it came straight from disk without a network call, its fetch time.
+        """
+        path = self._disk_cache_path(symbol, fetch_period)
+        if not self._uses_disk_cache(fetch_period):
+            return None, None
+        
+        try:
+            saved_at = os.path.getmtime(path)
+            data = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            print(f"⚠️ {symbol}: Unreadable disk cache - {e}")
+            return None, None
+        
+        if data.empty:
+            return None, None
+        data = self._naive_index(data)  # files written before indexes were stored tz-naive
+        
+        # The file's mtime is its fetch time, so the memory cache's freshness rule applies
+        if self._is_fresh(saved_at, current_time):
+            return data, saved_at
+        
+        # Refetch from the last stored day, which may have been saved mid-session
+        last_day = data.index[-1].strftime('%Y-%m-%d')
+        new_data = ticker.history(start=last_day)
+        if new_data is not None and not new_data.empty:
+            new_data = self._naive_index(new_data)
+            
+            # Prices are split/dividend adjusted, so after a corporate action the stored bars are
+            # on a different scale; refetch the whole history rather than splice the two
+            if self._history_was_adjusted(data, new_data):
+                print(f"⚠️ {symbol}: Split/dividend since the disk cache was saved - refetching full history")
+                self._remove_disk_file(path)
+                return None, None
+            
+            new_data = self._clean_data(new_data)
+            if len(new_data) > 0:
+                try:
+                    data = pd.concat([data[data.index < new_data.index[0]], new_data])
+                except (TypeError, ValueError) as e:
+                    # Incompatible indexes: a full download beats failing the whole fetch
+                    print(f"⚠️ {symbol}: Could not extend disk cache ({e}) - refetching full history")
+                    self._remove_disk_file(path)
+                    return None, None
+        
+        offset = PERIOD_OFFSETS.get(fetch_period)
+        if offset is not None:
+            data = data[data.index >= data.index[-1] - offset]
+        
+        return data, None
+    
+    @staticmethod
+    def _history_was_adjusted(stored: pd.DataFrame, new_data: pd.DataFrame) -> bool:
+        """Whether freshly fetched bars can't be appended to stored ones (corporate action or rescaled overlap)."""
+        for col in ('Stock Splits', 'Dividends'):
+            if col in new_data.columns and (new_data[col].fillna(0) != 0).any():
+                return True
+        
+        # The refetch starts at the last stored day; that bar must still match what was stored
+        overlap = stored['Close'].reindex(new_data.index).dropna()
+        if overlap.empty:
+            return False
+        refetched = new_data['Close'].reindex(overlap.index).to_numpy(dtype=np.float64)
+        return not np.allclose(overlap.to_numpy(dtype=np.float64), refetched, rtol=1e-3)
+    
+    @staticmethod
+    def _remove_disk_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _save_to_disk(self, data: pd.DataFrame, symbol: str, fetch_period: str):
+        if not self._uses_disk_cache(fetch_period):
+            return
+        
+        # The tick and chart workers can save the same symbol at once: write a private temp file and swap it in
+        path = self._disk_cache_path(symbol, fetch_period)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.disk_cache_dir, exist_ok=True)
+            data.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ {symbol}: Could not write disk cache - {e}")
+            self._remove_disk_file(tmp_path)
+    
+    def _prune_disk_cache(self):
+        """Drop persisted histories untouched for a month, then the oldest ones beyond the size cap."""
+        if not os.path.isdir(self.disk_cache_dir):
+            return
+        
+        cutoff = time.time() - self.disk_cache_max_age
+        kept = []
+        for entry in os.scandir(self.disk_cache_dir):
+            try:
+                # Temp files are only left behind by a crash mid-write
+                if entry.name.endswith('.tmp') and entry.stat().st_mtime < time.time() - 3600:
+                    os.remove(entry.path)
+                if not entry.name.endswith('.parquet'):
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime < cutoff:
+                    os.remove(entry.path)
+                else:
+                    kept.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                pass
+        
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= self.disk_cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
     def _get_actual_fetch_period(self, period: str) -> str:
         """FIXED: Get the actual period to fetch from yfinance."""
         if period in ['max', '10y', '5y']:
@@ -141,53 +778,68 @@ class FixedStockData:
     def _filter_data_for_period(self, data: pd.DataFrame, period: str) -> pd.DataFrame:
         """FIXED: Filter data to the exact requested period."""
         if period == '5y':
-            cutoff_date = datetime.now() - timedelta(days=1825)
-            filtered = data[data.index >= cutoff_date]
+            filtered = self._slice_since(data, 1825)
             print(f"🔧 FIXED: Filtered 5y data: {len(data)} -> {len(filtered)} points")
             return filtered
         elif period == '10y':
-            cutoff_date = datetime.now() - timedelta(days=3650)
-            filtered = data[data.index >= cutoff_date]
+            filtered = self._slice_since(data, 3650)
             print(f"🔧 FIXED: Filtered 10y data: {len(data)} -> {len(filtered)} points")
             return filtered
         else:
             return data
     
+    def _slice_since(self, data: pd.DataFrame, days: int) -> pd.DataFrame:
+        """Rows from the last `days` days via binary search on the sorted index."""
+        # Indexes are exchange-local and tz-naive; hours of skew are irrelevant at a years-long cutoff
+        cutoff = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days))
+        start = data.index.values.searchsorted(cutoff)
+        return data.iloc[start:]
+    
     def get_stock_info(self, symbol: str) -> Dict:
+        # ticker.info is a large JSON request; reuse it for cache_timeout seconds
+        cached = self._info_cache.get(symbol)
+        if cached and time.time() - cached[0] < self.cache_timeout:
+            return cached[1]
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol, session=self._get_session())
             info = ticker.info
             
-            return {
+            result = {
                 'shares_outstanding': info.get('sharesOutstanding', 0),
                 'market_cap': info.get('marketCap', 0),
                 'current_price': info.get('currentPrice') or info.get('regularMarketPrice'),
                 'company_name': info.get('longName', symbol)
             }
+            self._info_cache[symbol] = (time.time(), result)
+            return result
         except:
             return {'shares_outstanding': 0, 'market_cap': 0, 'current_price': None, 'company_name': symbol}
     
     def format_market_cap(self, market_cap: int) -> str:
-        if market_cap >= 1_000_000_000_000:
-            return f"${market_cap / 1_000_000_000_000:.2f}T"
-        elif market_cap >= 1_000_000_000:
-            return f"${market_cap / 1_000_000_000:.2f}B"
-        elif market_cap >= 1_000_000:
-            return f"${market_cap / 1_000_000:.1f}M"
-        else:
-            return f"${market_cap:,.0f}"
+        return _format_market_cap(market_cap)
     
     def format_volume(self, volume: int) -> str:
-        if volume >= 1_000_000_000:
-            return f"{volume / 1_000_000_000:.2f}B"
-        elif volume >= 1_000_000:
-            return f"{volume / 1_000_000:.1f}M"
-        elif volume >= 1_000:
-            return f"{volume / 1_000:.1f}K"
-        else:
-            return f"{volume:,}"
+        for scale, suffix, decimals in VOLUME_SCALES:
+            if volume >= scale:
+                return f"{volume / scale:.{decimals}f}{suffix}"
+        return f"{volume:,}"
 
 class WidgetFixedRSITracker:
+    # Long histories are downsampled to this many plotted points (about the chart's pixel width)
+    MAX_PLOT_POINTS = 1500
+    
+    # Volume bar colours by code: up day, down day, first bar (no previous close)
+    VOLUME_PALETTE = np.array(['#44ff44', '#ff4444', '#888888'])
+    
+    # Chart indicators are kept for this many recently charted symbols (a 'max' entry is ~0.5 MB)
+    DERIVED_CACHE_SYMBOLS = 16
+    
+    # Table status by zone: below 30, 30 to 70 inclusive, above 70
+    RSI_STATUS = ("🟢 Oversold", "🟡 Neutral", "🔴 Overbought")
+    
+    # Table RSI states are seeded from this much history so they match the chart's full-history RSI
+    RSI_SEED_PERIOD = "1y"
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Ultimate Enhanced RSI Tracker - 🔧 WIDGET FIXED VERSION")
@@ -196,20 +848,42 @@ class WidgetFixedRSITracker:
         
         self.stock_data = FixedStockData()
         self.rsi_calculator = RSICalculator()
+        # All background work (refreshes, validation, chart fetches) shares one pool of I/O-bound workers
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.executor.submit(self.warm_up_kernels)
+        self.derived_cache = OrderedDict()  # symbol -> {period: chart indicators}, LRU order
+        self._derived_lock = threading.Lock()  # chart workers and the Tk thread both use the cache
+        self._rsi_state = {}  # symbol -> (newest bar time, Wilder state through the bar before it)
         
         self.selected_symbol = None
         self.current_canvas = None
+        self._current_fig = None
+        self._chart_axes = None
+        self._chart_layout = None  # which optional series the current plot has
+        self._artists = {}  # plotted artists by name, updated in place when the layout is unchanged
+        self._date_format = None  # x-axis format currently installed on the chart axes
+        self._chart_request = 0  # bumped per chart load so stale background results are dropped
         self.chart_frame = None  # FIXED: Explicit chart frame reference
         
         # Watchlist
         self.watchlist = []
         self.watchlist_file = "watchlist.json"
+        self._save_pending = None  # root.after() id of a debounced save
+        self._watchlist_version = 0  # bumped whenever the watchlist changes
+        self._combo_version = -1  # watchlist version last pushed to the chart symbol combo
+        
+        # Row updates from worker threads, applied to the table in one batch
+        self._row_queue = {}
+        self._row_lock = threading.Lock()
+        self._flush_scheduled = False
         self.load_watchlist()
         
         # Update control
         self.update_interval = 30
         self.is_updating = False
-        self.update_thread = None
+        self._tick_id = None  # pending root.after() id of the next periodic refresh
+        self._tick_future = None
+        self._refresh_future = None  # manual refresh in progress
         
         self.setup_ui()
         self.setup_styles()
@@ -297,10 +971,12 @@ class WidgetFixedRSITracker:
         self.status_label = tk.Label(status_frame, text="🔧 WIDGET FIXED VERSION - All features working with market cap analysis!", 
                                     bg='#1e1e1e', fg='#cccccc', font=('Arial', 9))
         self.status_label.pack(side=tk.LEFT)
+        self.status_label.bind('<Destroy>', lambda e: setattr(self, 'status_label', None))
         
         self.last_update_label = tk.Label(status_frame, text="", 
                                          bg='#1e1e1e', fg='#888888', font=('Arial', 9))
         self.last_update_label.pack(side=tk.RIGHT)
+        self.last_update_label.bind('<Destroy>', lambda e: setattr(self, 'last_update_label', None))
         
         # Table
         self.setup_table(tracker_frame)
@@ -353,6 +1029,7 @@ class WidgetFixedRSITracker:
         self.debug_label = tk.Label(debug_frame, text="Ready", 
                                    bg='#1e1e1e', fg='#888888', font=('Arial', 9))
         self.debug_label.pack()
+        self.debug_label.bind('<Destroy>', lambda e: setattr(self, 'debug_label', None))
         
         # FIXED: Chart display with proper frame management
         self.chart_frame = tk.Frame(charts_frame, bg='#1e1e1e')
@@ -378,14 +1055,16 @@ class WidgetFixedRSITracker:
     def clear_chart_safely(self):
         """FIXED: Safely clear chart without breaking widget references"""
         try:
-            # Destroy current canvas if it exists
-            if self.current_canvas:
-                self.current_canvas.get_tk_widget().destroy()
-                self.current_canvas = None
+            # The chart canvas is reused across loads, so only hide it
+            canvas_widget = self.current_canvas.get_tk_widget() if self.current_canvas else None
+            if canvas_widget is not None:
+                canvas_widget.pack_forget()
             
-            # Clear all widgets in chart frame safely
+            # Clear all other widgets in chart frame safely
             if self.chart_frame and self.chart_frame.winfo_exists():
                 for widget in self.chart_frame.winfo_children():
+                    if widget is canvas_widget:
+                        continue
                     try:
                         widget.destroy()
                     except tk.TclError:
@@ -402,20 +1081,16 @@ class WidgetFixedRSITracker:
             print(f"🔧 WIDGET FIXED: Period dropdown changed to '{period}' for symbol '{symbol}'")
             
             if not symbol:
-                self.debug_label.config(text=f"Period: {period} (no symbol)")
+                self._set_debug(f"Period: {period} (no symbol)")
                 return
             
             # Update debug info safely
-            if self.debug_label.winfo_exists():
-                self.debug_label.config(text=f"Loading: {symbol} ({period})")
-            
-            if self.status_label.winfo_exists():
-                self.status_label.config(text=f"🔧 Auto-loading {symbol} for period '{period}'...")
+            self._set_debug(f"Loading: {symbol} ({period})")
             
-            self.root.update()
+            self._set_status(f"🔧 Auto-loading {symbol} for period '{period}'...")
             
-            # FIXED: Load with delay to prevent widget conflicts
-            self.root.after(200, self.load_chart_WIDGET_FIXED)
+            # Load once the labels have repainted; no forced update() or fixed delay
+            self.root.after_idle(self.load_chart_WIDGET_FIXED)
             
         except Exception as e:
             print(f"❌ Error in period change handler: {e}")
@@ -423,7 +1098,7 @@ class WidgetFixedRSITracker:
     def load_chart_WIDGET_FIXED(self):
         """FIXED: Load chart with proper widget management."""
         try:
-            if not CHARTS_AVAILABLE:
+            if not charts_available():
                 messagebox.showwarning("Charts Not Available", "Install matplotlib: pip install matplotlib")
                 return
             
@@ -437,8 +1112,7 @@ class WidgetFixedRSITracker:
             print(f"🔧 WIDGET FIXED: Loading chart for symbol='{symbol}', period='{period}'")
             
             # Update debug display safely
-            if self.debug_label and self.debug_label.winfo_exists():
-                self.debug_label.config(text=f"Fetching: {symbol} ({period})")
+            self._set_debug(f"Fetching: {symbol} ({period})")
             
             # FIXED: Clear chart safely before loading new one
             self.clear_chart_safely()
@@ -448,72 +1122,123 @@ class WidgetFixedRSITracker:
             loading_label = tk.Label(self.chart_frame, text=loading_text,
                                    bg='#1e1e1e', fg='#cccccc', font=('Arial', 12))
             loading_label.pack(expand=True)
-            self.root.update()
             
+            # Fetch and compute in the background; only the newest request gets drawn
+            self._chart_request += 1
+            self.executor.submit(self._fetch_chart_data, self._chart_request, symbol, period)
+            
+        except Exception as e:
+            self._show_chart_error(e)
+    
+    def _fetch_chart_data(self, request_id: int, symbol: str, period: str):
+        """Worker thread: download the data and indicators for a chart, then draw it on the Tk thread."""
+        try:
             # FIXED: Fetch data with enhanced error handling
             print(f"🌐 WIDGET FIXED: Calling get_stock_data('{symbol}', '{period}')")
             data = self.stock_data.get_stock_data(symbol, period)
             
+            stock_info = None
+            if data is not None and not data.empty:
+                stock_info = self.stock_data.get_stock_info(symbol)
+                self._derived(symbol, period, data)  # the chart then reads these from the cache
+        except Exception as e:
+            self._post(self._show_chart_error, e, request_id)
+            return
+        
+        self._post(self._show_chart, request_id, symbol, period, data, stock_info)
+    
+    def _show_chart(self, request_id: int, symbol: str, period: str, data: Optional[pd.DataFrame], stock_info: Optional[Dict]):
+        """Draw a fetched chart unless a newer load has been requested meanwhile."""
+        if request_id != self._chart_request:
+            print(f"⏭️ WIDGET FIXED: Skipping superseded chart for {symbol} ({period})")
+            return
+        
+        try:
+            # Clear loading message
+            self.clear_chart_safely()
+            
             if data is None or data.empty:
                 error_msg = f"No data available for {symbol} (period: {period})\nSymbol may be delisted or invalid."
                 print(f"❌ {error_msg}")
                 
-                # Clear loading message
-                loading_label.destroy()
-                
                 # Show error message
                 error_label = tk.Label(self.chart_frame, text=error_msg,
                                      bg='#1e1e1e', fg='#ff4444', font=('Arial', 12))
                 error_label.pack(expand=True)
                 
-                if self.debug_label and self.debug_label.winfo_exists():
-                    self.debug_label.config(text="Error: No data")
+                self._set_debug("Error: No data")
                 return
             
-            # Get stock info
-            stock_info = self.stock_data.get_stock_info(symbol)
-            
-            # Clear loading message
-            loading_label.destroy()
-            
             # FIXED: Create chart with safe widget management
             print(f"✅ WIDGET FIXED: Creating chart with {len(data)} data points for {symbol} ({period})")
             self.create_complete_chart_WIDGET_FIXED(symbol, data, period, stock_info)
             
             # Update status with verification
-            data_start = data.index[0].strftime('%Y-%m-%d')
-            data_end = data.index[-1].strftime('%Y-%m-%d')
             data_span = (data.index[-1] - data.index[0]).days
             
             status_msg = f"✅ WIDGET FIXED: {symbol} ({period}) - {len(data)} points, {data_span} days"
-            if self.status_label and self.status_label.winfo_exists():
-                self.status_label.config(text=status_msg)
+            self._set_status(status_msg)
             
-            if self.debug_label and self.debug_label.winfo_exists():
-                self.debug_label.config(text=f"✅ {symbol} ({period}) - {len(data)} pts")
+            self._set_debug(f"✅ {symbol} ({period}) - {len(data)} pts")
             
             print(f"✅ WIDGET FIXED: Chart loaded successfully!")
             
         except Exception as e:
-            error_msg = f"❌ WIDGET FIXED: Error loading chart: {e}"
-            print(error_msg)
-            
-            # Clear any widgets safely
-            self.clear_chart_safely()
-            
-            # Show error
-            error_label = tk.Label(self.chart_frame, text=f"Error loading chart:\n{str(e)}",
-                                 bg='#1e1e1e', fg='#ff4444', font=('Arial', 12))
-            error_label.pack(expand=True)
-            
-            if self.debug_label and self.debug_label.winfo_exists():
-                self.debug_label.config(text="Error occurred")
+            self._show_chart_error(e)
+    
+    def _set_label(self, name: str, text: str):
+        """Set a label's text; labels clear their attribute on <Destroy>, so no winfo_exists() probe."""
+        label = getattr(self, name, None)
+        if label is None:
+            return
+        try:
+            label.configure(text=text)
+        except tk.TclError:
+            setattr(self, name, None)
+    
+    def _set_status(self, text: str):
+        self._set_label('status_label', text)
+    
+    def _set_debug(self, text: str):
+        self._set_label('debug_label', text)
+    
+    def _show_chart_error(self, e: Exception, request_id: Optional[int] = None):
+        if request_id is not None and request_id != self._chart_request:
+            return
+        
+        error_msg = f"❌ WIDGET FIXED: Error loading chart: {e}"
+        print(error_msg)
+        
+        # Clear any widgets safely
+        self.clear_chart_safely()
+        
+        # Show error
+        error_label = tk.Label(self.chart_frame, text=f"Error loading chart:\n{str(e)}",
+                             bg='#1e1e1e', fg='#ff4444', font=('Arial', 12))
+        error_label.pack(expand=True)
+        
+        self._set_debug("Error occurred")
     
     def create_complete_chart_WIDGET_FIXED(self, symbol: str, data: pd.DataFrame, period: str, stock_info: Dict):
         """FIXED: Create chart with safe widget management and market cap analysis."""
         try:
-            # Create figure with 4 subplots including market cap
-            fig = Figure(figsize=(15, 12), facecolor='#1e1e1e')
+            # Raw arrays for scalar reads and plotting, instead of pandas indexers
+            close = data['Close'].to_numpy()
+            volume = data['Volume'].to_numpy()
+            avg_vol = volume.mean()
+            shares_outstanding = stock_info.get('shares_outstanding', 0)
+            
+            # Reuse the figure with its 4 subplots (including market cap) across loads; when the
+            # same series are drawn as last time, update the existing artists instead of replotting
+            fig, axes = self._get_chart_figure()
+            layout = (len(data) >= 20, len(data) >= 50, avg_vol > 0, shares_outstanding > 0)
+            reuse = layout == self._chart_layout
+            if not reuse:
+                for ax in axes:
+                    ax.clear()
+                self._artists = {}
+                self._chart_layout = layout
+            ax1, ax2, ax3, ax4 = axes
             
             # Data verification
             data_span_days = (data.index[-1] - data.index[0]).days
@@ -522,17 +1247,20 @@ class WidgetFixedRSITracker:
             
             print(f"📊 WIDGET FIXED: Chart data spans {data_span_days} days ({data_start} to {data_end})")
             
+            # Indicators use the full series; only the plotted points are downsampled
+            derived = self._derived(symbol, period, data)
+            plot_rows = derived['plot_rows']
+            plot_index = data.index[plot_rows]
+            
             # 1. PRICE CHART
-            ax1 = fig.add_subplot(411, facecolor='#2d2d2d')
-            ax1.plot(data.index, data['Close'], color='#00ff88', linewidth=2.5, label='Price')
+            self._line('price', ax1, plot_index, close[plot_rows], color='#00ff88', linewidth=2.5, label='Price')
             
             # Moving averages
+            ma20 = derived['ma20']
             if len(data) >= 20:
-                ma20 = data['Close'].rolling(window=20).mean()
-                ax1.plot(data.index, ma20, color='#ffaa00', linewidth=1.5, alpha=0.8, label='MA20')
+                self._line('ma20', ax1, plot_index, ma20[plot_rows], color='#ffaa00', linewidth=1.5, alpha=0.8, label='MA20')
             if len(data) >= 50:
-                ma50 = data['Close'].rolling(window=50).mean()
-                ax1.plot(data.index, ma50, color='#ff4444', linewidth=1.5, alpha=0.8, label='MA50')
+                self._line('ma50', ax1, plot_index, derived['ma50'][plot_rows], color='#ff4444', linewidth=1.5, alpha=0.8, label='MA50')
             
             # FIXED: Enhanced title with verification
             verified_title = f'✅ {symbol} - WIDGET FIXED (PERIOD: {period}) - {len(data)} points | {data_start} to {data_end}'
@@ -543,18 +1271,18 @@ class WidgetFixedRSITracker:
             ax1.tick_params(colors='white')
             
             # 2. RSI CHART
-            ax2 = fig.add_subplot(412, facecolor='#2d2d2d')
-            rsi_data = self.rsi_calculator.calculate_rsi(data['Close'])
-            current_rsi = rsi_data.iloc[-1]
+            rsi_data = derived['rsi'].to_numpy()
+            current_rsi = rsi_data[-1]
             
-            ax2.plot(data.index, rsi_data, color='#4488ff', linewidth=2.5, label='RSI')
-            ax2.axhline(y=70, color='#ff4444', linestyle='--', alpha=0.8, label='Overbought (70)')
-            ax2.axhline(y=30, color='#44ff44', linestyle='--', alpha=0.8, label='Oversold (30)')
-            ax2.axhline(y=50, color='#888888', linestyle='-', alpha=0.6, label='Neutral (50)')
+            self._line('rsi', ax2, plot_index, rsi_data[plot_rows], color='#4488ff', linewidth=2.5, label='RSI')
+            if not reuse:
+                ax2.axhline(y=70, color='#ff4444', linestyle='--', alpha=0.8, label='Overbought (70)')
+                ax2.axhline(y=30, color='#44ff44', linestyle='--', alpha=0.8, label='Oversold (30)')
+                ax2.axhline(y=50, color='#888888', linestyle='-', alpha=0.6, label='Neutral (50)')
             
             # RSI zones
-            ax2.fill_between(data.index, 70, 100, alpha=0.1, color='red')
-            ax2.fill_between(data.index, 0, 30, alpha=0.1, color='green')
+            self._swap('rsi_high', ax2.fill_between(plot_index, 70, 100, alpha=0.1, color='red'))
+            self._swap('rsi_low', ax2.fill_between(plot_index, 0, 30, alpha=0.1, color='green'))
             
             rsi_status = "Overbought" if current_rsi > 70 else "Oversold" if current_rsi < 30 else "Neutral"
             rsi_color = "#ff4444" if current_rsi > 70 else "#44ff44" if current_rsi < 30 else "#ffaa00"
@@ -568,28 +1296,18 @@ class WidgetFixedRSITracker:
             ax2.tick_params(colors='white')
             
             # 3. VOLUME CHART
-            ax3 = fig.add_subplot(413, facecolor='#2d2d2d')
-            
-            # Color volume bars
-            volume_colors = []
-            for i in range(len(data)):
-                if i == 0:
-                    volume_colors.append('#888888')
-                else:
-                    if data['Close'].iloc[i] >= data['Close'].iloc[i-1]:
-                        volume_colors.append('#44ff44')
-                    else:
-                        volume_colors.append('#ff4444')
-            
-            ax3.bar(data.index, data['Volume'], color=volume_colors, alpha=0.7)
+            self._swap('volume', ax3.bar(plot_index, volume[plot_rows].astype(np.float32), color=self.VOLUME_PALETTE[derived['volume_codes'][plot_rows]].tolist(), alpha=0.7))
             
             # Average volume
-            avg_vol = data['Volume'].mean()
             if avg_vol > 0:
-                ax3.axhline(y=avg_vol, color='#ffaa00', linewidth=2, 
-                           label=f'Avg Vol: {self.stock_data.format_volume(int(avg_vol))}')
+                avg_label = f'Avg Vol: {self.stock_data.format_volume(int(avg_vol))}'
+                if reuse:
+                    self._artists['avg_vol'].set_ydata([avg_vol, avg_vol])
+                    self._artists['avg_vol'].set_label(avg_label)
+                else:
+                    self._artists['avg_vol'] = ax3.axhline(y=avg_vol, color='#ffaa00', linewidth=2, label=avg_label)
             
-            current_vol = int(data['Volume'].iloc[-1])
+            current_vol = int(volume[-1])
             vol_vs_avg = (current_vol / avg_vol - 1) * 100 if avg_vol > 0 else 0
             vol_status = f"+{vol_vs_avg:.0f}%" if vol_vs_avg > 0 else f"{vol_vs_avg:.0f}%"
             
@@ -601,32 +1319,30 @@ class WidgetFixedRSITracker:
             ax3.tick_params(colors='white')
             
             # 4. MARKET CAP CHART
-            ax4 = fig.add_subplot(414, facecolor='#2d2d2d')
-            
-            shares_outstanding = stock_info.get('shares_outstanding', 0)
             if shares_outstanding > 0:
-                # Market cap over time
-                market_cap_series = data['Close'] * shares_outstanding
-                ax4.plot(data.index, market_cap_series, color='#ff8844', linewidth=2.5, label='Market Cap')
-                ax4.fill_between(data.index, market_cap_series, alpha=0.2, color='#ff8844')
+                # Market cap over time (float32, like the prices: plenty for drawing)
+                market_cap_series = close.astype(np.float32) * np.float32(shares_outstanding)
+                self._line('market_cap', ax4, plot_index, market_cap_series[plot_rows], color='#ff8844', linewidth=2.5, label='Market Cap')
+                self._swap('market_cap_fill', ax4.fill_between(plot_index, market_cap_series[plot_rows], alpha=0.2, color='#ff8844'))
                 
-                # Market cap moving average
+                # Market cap moving average (shares are constant, so it is just MA20 scaled)
                 if len(data) >= 20:
-                    mc_ma = market_cap_series.rolling(window=20).mean()
-                    ax4.plot(data.index, mc_ma, color='#ffaa00', linewidth=1.5, alpha=0.8, label='MC MA20')
+                    mc_ma = (ma20 * shares_outstanding).astype(np.float32)
+                    self._line('mc_ma20', ax4, plot_index, mc_ma[plot_rows], color='#ffaa00', linewidth=1.5, alpha=0.8, label='MC MA20')
                 
-                current_mc = market_cap_series.iloc[-1]
+                current_mc = market_cap_series[-1]
                 ax4.set_title(f'Market Cap Trend - Current: {self.stock_data.format_market_cap(int(current_mc))}', 
                              color='white', fontsize=12, fontweight='bold')
                 ax4.set_ylabel('Market Cap ($)', color='white')
                 ax4.yaxis.set_major_formatter(plt.FuncFormatter(self._format_market_cap_axis))
             else:
                 # Price performance fallback
-                normalized_price = (data['Close'] / data['Close'].iloc[0]) * 100
-                ax4.plot(data.index, normalized_price, color='#8844ff', linewidth=2.5, label='Price Performance %')
-                ax4.axhline(y=100, color='#888888', linestyle='-', alpha=0.5, label='Baseline')
+                normalized_price = (close / close[0]) * 100
+                self._line('performance', ax4, plot_index, normalized_price[plot_rows], color='#8844ff', linewidth=2.5, label='Price Performance %')
+                if not reuse:
+                    ax4.axhline(y=100, color='#888888', linestyle='-', alpha=0.5, label='Baseline')
                 
-                current_perf = normalized_price.iloc[-1] - 100
+                current_perf = normalized_price[-1] - 100
                 perf_status = f"+{current_perf:.1f}%" if current_perf >= 0 else f"{current_perf:.1f}%"
                 ax4.set_title(f'Price Performance - {perf_status} vs start', 
                              color='white', fontsize=12, fontweight='bold')
@@ -645,33 +1361,123 @@ class WidgetFixedRSITracker:
             else:
                 date_format = '%m/%d'
             
-            for ax in [ax1, ax2, ax3, ax4]:
-                ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
-            
-            fig.autofmt_xdate(rotation=45)
-            fig.tight_layout(pad=2.0)
-            
-            # FIXED: Embed in tkinter with safe widget management
-            self.current_canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-            self.current_canvas.draw()
+            # Cleared axes lose their formatter; otherwise only swap it when the format changes
+            if not reuse or date_format != self._date_format:
+                for ax in [ax1, ax2, ax3, ax4]:
+                    ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+                self._date_format = date_format
+            
+            if reuse:
+                # relim() ignores collections, so fold the fills back in before rescaling
+                for ax in axes:
+                    ax.relim()
+                    for collection in ax.collections:
+                        ax.update_datalim(collection.get_datalim(ax.transData).get_points())
+                    ax.autoscale_view()
+            
+            # Tick label rotation carries over to new ticks; autofmt_xdate would also reset the margins
+            if not reuse:
+                fig.autofmt_xdate(rotation=45)
+                fig.tight_layout(pad=2.0)
+            
+            # FIXED: Show the (reused) canvas with safe widget management
+            self.current_canvas.draw_idle()
             self.current_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
             print(f"✅ WIDGET FIXED: Chart embedded successfully")
             
         except Exception as e:
             print(f"❌ Error creating chart: {e}")
+            self._chart_layout = None  # partially drawn; replot from scratch next time
             raise
     
+    def _get_chart_figure(self):
+        """The chart figure and its axes, created with the Tk canvas on first use."""
+        if self._current_fig is None:
+            fig = Figure(figsize=(15, 12), facecolor='#1e1e1e')
+            self._chart_axes = [fig.add_subplot(411 + i, facecolor='#2d2d2d') for i in range(4)]
+            self.current_canvas = FigureCanvasTkAgg(fig, self.chart_frame)
+            self._current_fig = fig
+        return self._current_fig, self._chart_axes
+    
+    def _line(self, key: str, ax, x, y, **style):
+        """Plot a named line, or move the existing one to the new data."""
+        line = self._artists.get(key)
+        if line is None:
+            self._artists[key] = ax.plot(x, y, **style)[0]
+        else:
+            line.set_data(x, y)
+    
+    def _swap(self, key: str, artist):
+        """Track a named non-line artist (bars, fills), removing the one it replaces."""
+        old = self._artists.get(key)
+        if old is not None:
+            old.remove()
+        self._artists[key] = artist
+    
+    def _plot_rows(self, data: pd.DataFrame):
+        """Rows to draw: all of them, or an LTTB selection that keeps the shape of the close series."""
+        if len(data) <= self.MAX_PLOT_POINTS:
+            return slice(None)
+        x = data.index.asi8.astype(np.float64)
+        y = data['Close'].to_numpy(dtype=np.float64)
+        return _lttb_indices_nb(x, y, self.MAX_PLOT_POINTS)
+    
+    def warm_up_kernels(self):
+        """Compile the numba kernels in the background so the first chart doesn't pay for it."""
+        self.rsi_calculator.warm_up()
+        _lttb_indices_nb(np.arange(8.0), np.arange(8.0), 4)
+    
+    def _derived(self, symbol: str, period: str, data: pd.DataFrame) -> Dict:
+        """Chart indicators for (symbol, period), recomputed only when the underlying data changes."""
+        close = data['Close'].to_numpy()
+        stamp = (len(data), data.index[-1], close[-1])
+        with self._derived_lock:
+            periods = self.derived_cache.get(symbol)
+            if periods is not None:
+                self.derived_cache.move_to_end(symbol)
+                entry = periods.get(period)
+                if entry is not None and entry['stamp'] == stamp:
+                    return entry
+        
+        # Index into VOLUME_PALETTE; int8 codes instead of a '<U7' string per bar
+        volume_codes = (np.diff(close, prepend=close[0]) < 0).astype(np.int8)
+        volume_codes[0] = 2
+        entry = {
+            'stamp': stamp,
+            'rsi': self.rsi_calculator.calculate_rsi(data['Close']),
+            'ma20': self._moving_average(close, 20),
+            'ma50': self._moving_average(close, 50),
+            'volume_codes': volume_codes,
+            'plot_rows': self._plot_rows(data),
+        }
+        with self._derived_lock:
+            self.derived_cache.setdefault(symbol, {})[period] = entry
+            self.derived_cache.move_to_end(symbol)
+            while len(self.derived_cache) > self.DERIVED_CACHE_SYMBOLS:
+                self.derived_cache.popitem(last=False)
+        return entry
+    
+    def _drop_derived(self, symbol: str):
+        """Forget cached chart indicators for a symbol."""
+        with self._derived_lock:
+            self.derived_cache.pop(symbol, None)
+    
+    @staticmethod
+    def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+        """Trailing simple moving average; the first window-1 points are NaN like rolling().mean()."""
+        ma = np.full(len(values), np.nan)
+        if len(values) >= window:
+            ma[window - 1:] = np.convolve(values, np.full(window, 1.0 / window), mode='valid')
+        return ma
+    
     def _format_market_cap_axis(self, x, p):
         """Format market cap axis values."""
-        if x >= 1_000_000_000_000:
-            return f'${x/1_000_000_000_000:.1f}T'
-        elif x >= 1_000_000_000:
-            return f'${x/1_000_000_000:.1f}B'
-        elif x >= 1_000_000:
-            return f'${x/1_000_000:.1f}M'
-        else:
-            return f'${x:,.0f}'
+        # Same thresholds as format_market_cap, one decimal for tick labels
+        for scale, suffix, _ in CAP_SCALES:
+            if x >= scale:
+                return f'${x / scale:.1f}{suffix}'
+        return f'${x:,.0f}'
     
     def clear_cache_and_reload(self):
         """Clear cache and reload with fresh data."""
@@ -686,19 +1492,14 @@ class WidgetFixedRSITracker:
             print(f"🗑️ WIDGET FIXED: Clearing cache for all {symbol} data")
             
             # Clear all cache entries for this symbol
-            keys_to_remove = [key for key in self.stock_data.cache.keys() if key.startswith(f"{symbol}_")]
-            for key in keys_to_remove:
-                del self.stock_data.cache[key]
+            for key in self.stock_data.evict_symbol(symbol):
                 print(f"🗑️ Removed cache key: {key}")
+            self._drop_derived(symbol)
             
-            if self.status_label and self.status_label.winfo_exists():
-                self.status_label.config(text=f"🗑️ Cache cleared for {symbol}, loading fresh {period} data...")
-            if self.debug_label and self.debug_label.winfo_exists():
-                self.debug_label.config(text="Fresh data loading...")
+            self._set_status(f"🗑️ Cache cleared for {symbol}, loading fresh {period} data...")
+            self._set_debug("Fresh data loading...")
             
-            self.root.update()
-            time.sleep(0.3)
-            self.load_chart_WIDGET_FIXED()
+            self.root.after_idle(self.load_chart_WIDGET_FIXED)
             
         except Exception as e:
             print(f"❌ Error clearing cache: {e}")
@@ -754,16 +1555,22 @@ class WidgetFixedRSITracker:
         if selected:
             self.selected_symbol = selected[0]
             self.chart_symbol_var.set(self.selected_symbol)
-            self.chart_symbol_combo['values'] = self.watchlist
+            self._sync_symbol_combo()
     
     def on_tab_changed(self, event):
         if "Charts" in event.widget.tab(event.widget.select(), "text"):
-            self.chart_symbol_combo['values'] = self.watchlist
+            self._sync_symbol_combo()
             if self.selected_symbol:
                 self.chart_symbol_var.set(self.selected_symbol)
     
+    def _sync_symbol_combo(self):
+        """Push the watchlist into the chart symbol combo only when it has changed."""
+        if self._combo_version != self._watchlist_version:
+            self.chart_symbol_combo['values'] = self.watchlist
+            self._combo_version = self._watchlist_version
+    
     def view_chart(self):
-        if not CHARTS_AVAILABLE:
+        if not charts_available():
             messagebox.showwarning("Charts Not Available", "Install matplotlib: pip install matplotlib")
             return
             
@@ -787,23 +1594,34 @@ class WidgetFixedRSITracker:
             messagebox.showwarning("Duplicate", f"{symbol} already in watchlist!")
             return
         
-        # Quick validation
+        self._set_status(f"Validating {symbol}...")
+        
+        # Quick validation runs off the Tk thread so the UI stays responsive
+        self.executor.submit(self._validate_stock, symbol)
+    
+    def _validate_stock(self, symbol: str):
         data = self.stock_data.get_stock_data(symbol, "5d")
         if data is None or data.empty:
-            messagebox.showerror("Invalid Symbol", f"Could not find data for {symbol}")
+            self._post(messagebox.showerror, "Invalid Symbol", f"Could not find data for {symbol}")
+            return
+        
+        self._post(self._finish_add_stock, symbol)
+    
+    def _finish_add_stock(self, symbol: str):
+        if symbol in self.watchlist:
             return
         
         self.watchlist.append(symbol)
+        self._watchlist_version += 1
         self.symbol_entry.delete(0, tk.END)
-        self.save_watchlist()
+        self.schedule_save()
         
         loading_values = (symbol, "Loading...", "", "", "", "", "")
         self.tree.insert('', tk.END, iid=symbol, values=loading_values)
         
         # Quick update
-        threading.Thread(target=self.update_stock_data, args=(symbol,), daemon=True).start()
-        if self.status_label and self.status_label.winfo_exists():
-            self.status_label.config(text=f"Added {symbol}")
+        self.executor.submit(self.update_stock_data, symbol)
+        self._set_status(f"Added {symbol}")
     
     def remove_stock(self):
         selected = self.tree.selection()
@@ -814,55 +1632,59 @@ class WidgetFixedRSITracker:
         symbol = selected[0]
         if messagebox.askyesno("Confirm Remove", f"Remove {symbol}?"):
             self.watchlist.remove(symbol)
+            self._watchlist_version += 1
             self.tree.delete(symbol)
-            self.save_watchlist()
-            if self.status_label and self.status_label.winfo_exists():
-                self.status_label.config(text=f"Removed {symbol}")
+            self._drop_derived(symbol)
+            self._rsi_state.pop(symbol, None)
+            self.schedule_save()
+            self._set_status(f"Removed {symbol}")
     
     def manual_refresh(self):
         if not self.watchlist:
             messagebox.showinfo("Empty Watchlist", "Add some stocks first!")
             return
         
-        if self.status_label and self.status_label.winfo_exists():
-            self.status_label.config(text="Refreshing all stocks...")
-        threading.Thread(target=self.refresh_all_stocks, daemon=True).start()
+        # A refresh already in flight covers this click; queuing more would only tie up workers
+        if self._refresh_future is not None and not self._refresh_future.done():
+            return
+        
+        self._set_status("Refreshing all stocks...")
+        self._refresh_future = self.executor.submit(self.refresh_all_stocks)
     
     def refresh_all_stocks(self):
-        for symbol in self.watchlist:
-            self.update_stock_data(symbol)
-            time.sleep(0.5)
+        self._update_watchlist()
         
-        if self.status_label and self.status_label.winfo_exists():
-            self.root.after(0, lambda: self.status_label.config(text="All stocks updated"))
+        self._post(self._set_status, "All stocks updated")
     
-    def update_stock_data(self, symbol: str):
+    def update_stock_data(self, symbol: str, hist_data: Optional[pd.DataFrame] = None):
         try:
-            hist_data = self.stock_data.get_stock_data(symbol, "1mo")
-            stock_info = self.stock_data.get_stock_info(symbol)
+            # Symbols missing from a batch download get a single-symbol retry
+            if hist_data is None:
+                hist_data = self.stock_data.get_stock_data(symbol, "1mo")
             
             if hist_data is None or hist_data.empty:
                 error_values = (symbol, "Error", "N/A", "N/A", "N/A", "N/A", "Error")
-                self.root.after(0, lambda: self.update_table_row(symbol, *error_values))
+                self._enqueue_row(symbol, error_values)
                 return
             
-            current_price = stock_info['current_price']
-            if current_price is None:
-                current_price = float(hist_data['Close'].iloc[-1])
+            # Read the closes as an array once instead of going through .iloc per value
+            closes = hist_data['Close']
+            prices = closes.to_numpy()
             
-            previous_price = float(hist_data['Close'].iloc[-2]) if len(hist_data) > 1 else current_price
+            # Today's bar of the batch download carries the latest price; no per-symbol quote request
+            current_price = float(prices[-1])
+            
+            previous_price = float(prices[-2]) if prices.size > 1 else current_price
             price_change = current_price - previous_price
             percent_change = (price_change / previous_price) * 100 if previous_price != 0 else 0
             
-            rsi_series = self.rsi_calculator.calculate_rsi(hist_data['Close'])
-            rsi = float(rsi_series.iloc[-1])
+            rsi = self._latest_rsi(symbol, closes, prices)
             
-            if rsi > 70:
-                rsi_status = "🔴 Overbought"
-            elif rsi < 30:
-                rsi_status = "🟢 Oversold"
-            else:
-                rsi_status = "🟡 Neutral"
+            rsi_status = self.RSI_STATUS[(rsi >= 30) + (rsi > 70)]
+            
+            # Ticks re-render cached bars, so show when the price was fetched, not when the row was drawn
+            fetched_at = self.stock_data.fetched_at(symbol, "1mo")
+            updated = datetime.fromtimestamp(fetched_at) if fetched_at is not None else datetime.now()
             
             values = (
                 symbol,
@@ -871,15 +1693,76 @@ class WidgetFixedRSITracker:
                 f"{percent_change:+.2f}%",
                 f"{rsi:.1f}",
                 rsi_status,
-                datetime.now().strftime("%H:%M:%S")
+                updated.strftime("%H:%M:%S")
             )
             
-            self.root.after(0, lambda: self.update_table_row(symbol, *values))
+            self._enqueue_row(symbol, values)
             
         except Exception as e:
             print(f"Error updating {symbol}: {e}")
             error_values = (symbol, "Error", "N/A", "N/A", "N/A", "N/A", "Error")
-            self.root.after(0, lambda: self.update_table_row(symbol, *error_values))
+            self._enqueue_row(symbol, error_values)
+    
+    def _latest_rsi(self, symbol: str, closes: pd.Series, values: np.ndarray, period: int = 14) -> float:
+        """RSI of the newest bar, advancing a per-symbol Wilder state instead of rescanning the series."""
+        state = None
+        entry = self._rsi_state.get(symbol)
+        if entry is not None and len(values) >= 3:
+            bar_time, saved = entry
+            # The previous close must match, or history was revised and the state is stale
+            if bar_time == closes.index[-1] and saved[2] == float(values[-2]):
+                state = saved  # same bar, new price
+            elif bar_time == closes.index[-2] and saved[2] == float(values[-3]):
+                state, _ = self.rsi_calculator.update(saved, float(values[-2]), period)  # a new bar opened
+        
+        if state is None:
+            if len(values) < period + 2:
+                return float(self.rsi_calculator.calculate_rsi(closes, period).iloc[-1])
+            state = self._seed_rsi_state(symbol, closes, values, period)
+        
+        self._rsi_state[symbol] = (closes.index[-1], state)
+        return self.rsi_calculator.update(state, float(values[-1]), period)[1]
+    
+    def _seed_rsi_state(self, symbol: str, closes: pd.Series, values: np.ndarray, period: int) -> Tuple[float, float, float]:
+        """Wilder state through the bar before the newest, warmed up on RSI_SEED_PERIOD of history.
+        
+        The 1mo refresh window is only a week past the warm-up, which leaves the RSI several points
+        off; the longer (cached) history brings it in line with the chart.
+        """
+        history = self.stock_data.get_stock_data(symbol, self.RSI_SEED_PERIOD)
+        if history is not None and not history.empty:
+            seed = history['Close']
+            seed = seed[seed.index < closes.index[-1]]
+            # Only trust the seed if it ends on the same bar and price as the refresh window
+            if (len(seed) > len(values) and seed.index[-1] == closes.index[-2]
+                    and np.isclose(seed.iloc[-1], values[-2], rtol=1e-4)):
+                avg_gain, avg_loss, _ = self.rsi_calculator.initial_state(seed, period)
+                return avg_gain, avg_loss, float(values[-2])
+        return self.rsi_calculator.initial_state(closes.iloc[:-1], period)
+    
+    def _post(self, func, *args):
+        """Run func on the Tk thread from a worker; dropped once the window is closing."""
+        if self.is_updating:
+            self.root.after(0, func, *args)
+    
+    def _enqueue_row(self, symbol: str, values: tuple):
+        """Queue a row update (from any thread); the first one of a batch schedules the flush."""
+        if not self.is_updating:
+            return  # the window is closing; the root may already be gone
+        with self._row_lock:
+            self._row_queue[symbol] = values
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(50, self._flush_rows)
+    
+    def _flush_rows(self):
+        """Apply every queued row update in one pass on the Tk thread."""
+        with self._row_lock:
+            rows, self._row_queue = self._row_queue, {}
+            self._flush_scheduled = False
+        for symbol, values in rows.items():
+            self.update_table_row(symbol, *values)
     
     def update_table_row(self, symbol: str, *values):
         try:
@@ -888,59 +1771,94 @@ class WidgetFixedRSITracker:
         except tk.TclError:
             pass
     
+    def _update_watchlist(self):
+        """Worker side of a refresh: one batched download, then each row from its slice of it."""
+        symbols = self.watchlist.copy()
+        # Each tick re-downloads while the market is open; today's daily bar carries the live price.
+        # The TTL sits a little under the tick interval so timer jitter never skips a round.
+        batch = self.stock_data.get_many(symbols, "1mo", max_age=self.update_interval - 5)
+        
+        # Symbols without an RSI state get their seed history in one batched request too
+        unseeded = [symbol for symbol in symbols if symbol not in self._rsi_state]
+        if unseeded:
+            self.stock_data.get_many(unseeded, self.RSI_SEED_PERIOD)
+        list(self.executor.map(self.update_stock_data, symbols, [batch.get(symbol) for symbol in symbols]))
+    
     def start_updates(self):
         if not self.is_updating:
             self.is_updating = True
-            self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
-            self.update_thread.start()
-    
-    def update_loop(self):
-        while self.is_updating:
-            if self.watchlist:
-                for symbol in self.watchlist.copy():
-                    if not self.is_updating:
-                        break
-                    self.update_stock_data(symbol)
-                    time.sleep(2)
-                
-                current_time = datetime.now().strftime("%H:%M:%S")
-                if self.last_update_label and self.last_update_label.winfo_exists():
-                    self.root.after(0, lambda: self.last_update_label.config(text=f"Last: {current_time}"))
-            
-            time.sleep(self.update_interval)
+            # First round once the mainloop is running, so the table rows exist
+            self._tick_id = self.root.after(0, self._tick)
+    
+    def _tick(self):
+        """Periodic refresh, scheduled on the Tk event loop; the downloads run on the executor."""
+        if not self.is_updating:
+            return
+        
+        # Skip a round while the previous one is still downloading
+        if self.watchlist and (self._tick_future is None or self._tick_future.done()):
+            self._tick_future = self.executor.submit(self._periodic_update)
+        self._tick_id = self.root.after(self.update_interval * 1000, self._tick)
+    
+    def _periodic_update(self):
+        self._update_watchlist()
+        
+        current_time = datetime.now().strftime("%H:%M:%S")
+        self._post(self._set_label, 'last_update_label', f"Last: {current_time}")
     
     def load_watchlist(self):
         try:
             if os.path.exists(self.watchlist_file):
-                with open(self.watchlist_file, 'r') as f:
-                    self.watchlist = json.load(f)
+                with open(self.watchlist_file, 'rb') as f:
+                    self.watchlist = _json_loads(f.read())
         except:
             self.watchlist = ["AAPL", "TSLA", "MSFT", "GOOGL", "NVDA"]  # Default stocks
+        self._watchlist_version += 1
+    
+    def schedule_save(self):
+        """Save shortly after the last edit, so a burst of adds/removes is one write."""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(500, self.save_watchlist)
     
     def save_watchlist(self):
+        self._save_pending = None
         try:
-            with open(self.watchlist_file, 'w') as f:
-                json.dump(self.watchlist, f)
+            # Write a temp file and swap it in, so a crash never leaves a truncated watchlist
+            tmp_file = self.watchlist_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self.watchlist))
+            os.replace(tmp_file, self.watchlist_file)
         except:
             pass
     
     def populate_initial_data(self):
-        for symbol in self.watchlist:
-            loading_values = (symbol, "Loading...", "", "", "", "", "")
-            self.tree.insert('', tk.END, iid=symbol, values=loading_values)
+        """Insert a loading row per symbol with one Tcl call instead of one tree.insert() each."""
+        if not self.watchlist:
+            return
+        script = f'{self.tree} insert {{}} end -id $symbol -values [list $symbol Loading... {{}} {{}} {{}} {{}} {{}}]'
+        self.tree.tk.call('foreach', 'symbol', tuple(self.watchlist), script)
     
     def on_closing(self):
         self.is_updating = False
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=2)
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self.save_watchlist()
+        # Queued downloads are dropped; the interpreter joins pool threads at exit, so don't leave it any
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # Python 3.8 has no cancel_futures
+            self.executor.shutdown(wait=False)
+        self.stock_data.close()
         self.root.destroy()
     
     def run(self):
         self.populate_initial_data()
         
         if not self.watchlist:
-            if self.status_label and self.status_label.winfo_exists():
-                self.status_label.config(text="🔧 WIDGET FIXED VERSION! Add stocks to test multiple chart loading.")
+            self._set_status("🔧 WIDGET FIXED VERSION! Add stocks to test multiple chart loading.")
         
         print("🚀 Starting WIDGET FIXED Ultimate RSI Tracker with Market Cap Analysis...")
         print("🔧 WIDGET FIXED VERSION with MARKET CAP ACTIVE!")